@@ -1,10 +1,9 @@
 # Copyright 2020 Pants project contributors (see CONTRIBUTORS.md).
 # Licensed under the Apache License, Version 2.0 (see LICENSE).
 
-import os.path
 import re
 from dataclasses import dataclass
-from typing import Match, Optional, Tuple, cast
+from typing import Optional, Tuple, cast
 
 from pants.backend.python.dependency_inference.module_mapper import (
     PythonModuleOwners,
@@ -41,23 +40,29 @@ from pants.engine.unions import UnionRule
 from pants.source.filespec import Filespec
 from pants.source.source_root import SourceRoot, SourceRootRequest
 from pants.util.docutil import doc_url
-from pants.util.strutil import softwrap
+from pants.util.strutil import lazy_help, softwrap
+
+
+def _handler_glob(spec_path: str, path: str) -> str:
+    return f"{spec_path}/{path}" if spec_path else path
 
 
 class PythonAwsLambdaHandlerField(StringField, AsyncFieldMixin, SecondaryOwnerMixin):
     alias = "handler"
     required = True
     value: str
-    help = softwrap(
-        """
-        Entry point to the AWS Lambda handler.
+    help = lazy_help(
+        lambda: softwrap(
+            """
+            Entry point to the AWS Lambda handler.
 
-        You can specify a full module like 'path.to.module:handler_func' or use a shorthand to
-        specify a file name, using the same syntax as the `sources` field, e.g.
-        'lambda.py:handler_func'.
+            You can specify a full module like 'path.to.module:handler_func' or use a shorthand to
+            specify a file name, using the same syntax as the `sources` field, e.g.
+            'lambda.py:handler_func'.
 
-        You must use the file name shorthand for file arguments to work with this target.
-        """
+            You must use the file name shorthand for file arguments to work with this target.
+            """
+        )
     )
 
     @classmethod
@@ -76,11 +81,11 @@ class PythonAwsLambdaHandlerField(StringField, AsyncFieldMixin, SecondaryOwnerMi
 
     @property
     def filespec(self) -> Filespec:
-        path, _, func = self.value.partition(":")
+        # NB: `compute_value` ensures that there is a `:`.
+        path = self.value[: self.value.find(":")]
         if not path.endswith(".py"):
             return {"includes": []}
-        full_glob = os.path.join(self.address.spec_path, path)
-        return {"includes": [full_glob]}
+        return {"includes": [_handler_glob(self.address.spec_path, path)]}
 
 
 @dataclass(frozen=True)
@@ -94,6 +99,36 @@ class ResolvePythonAwsHandlerRequest:
     field: PythonAwsLambdaHandlerField
 
 
+@dataclass(frozen=True)
+class PythonAwsHandlerModule:
+    module: str
+
+
+@dataclass(frozen=True)
+class PythonAwsHandlerModuleRequest:
+    """Convert a handler `.py` file path into a module name, relative to its source root.
+
+    This is keyed only by the file path, rather than by the handler field, so that the engine can
+    share the work between every `python_awslambda` target that uses the same handler file.
+    """
+
+    path: str
+
+
+@rule
+async def resolve_python_aws_handler_module(
+    request: PythonAwsHandlerModuleRequest,
+) -> PythonAwsHandlerModule:
+    assert request.path.endswith(".py"), f"Expected a `.py` file, but got: {request.path}"
+    source_root = await Get(SourceRoot, SourceRootRequest, SourceRootRequest.for_file(request.path))
+    # Paths from the engine are always normalized, relative and `/`-separated, so we can strip the
+    # source root and the extension with slicing rather than going through `os.path`.
+    stripped_source_path = (
+        request.path if source_root.path == "." else request.path[len(source_root.path) + 1 :]
+    )
+    return PythonAwsHandlerModule(stripped_source_path[: -len(".py")].replace("/", "."))
+
+
 @rule(desc="Determining the handler for a `python_awslambda` target")
 async def resolve_python_aws_handler(
     request: ResolvePythonAwsHandlerRequest,
@@ -101,7 +136,8 @@ async def resolve_python_aws_handler(
     handler_val = request.field.value
     field_alias = request.field.alias
     address = request.field.address
-    path, _, func = handler_val.partition(":")
+    func_sep = handler_val.find(":")
+    path = handler_val[:func_sep]
 
     # If it's already a module, simply use that. Otherwise, convert the file name into a module
     # path.
@@ -109,7 +145,7 @@ async def resolve_python_aws_handler(
         return ResolvedPythonAwsHandler(handler_val, file_name_used=False)
 
     # Use the engine to validate that the file exists and that it resolves to only one file.
-    full_glob = os.path.join(address.spec_path, path)
+    full_glob = _handler_glob(address.spec_path, path)
     handler_paths = await Get(
         Paths,
         PathGlobs(
@@ -133,15 +169,10 @@ async def resolve_python_aws_handler(
             )
         )
     handler_path = handler_paths.files[0]
-    source_root = await Get(
-        SourceRoot,
-        SourceRootRequest,
-        SourceRootRequest.for_file(handler_path),
+    handler_module = await Get(PythonAwsHandlerModule, PythonAwsHandlerModuleRequest(handler_path))
+    return ResolvedPythonAwsHandler(
+        f"{handler_module.module}{handler_val[func_sep:]}", file_name_used=True
     )
-    stripped_source_path = os.path.relpath(handler_path, source_root.path)
-    module_base, _ = os.path.splitext(stripped_source_path)
-    normalized_path = module_base.replace(os.path.sep, ".")
-    return ResolvedPythonAwsHandler(f"{normalized_path}:{func}", file_name_used=True)
 
 
 class PythonAwsLambdaDependencies(Dependencies):
@@ -165,6 +196,10 @@ class InferPythonLambdaHandlerDependency(InferDependenciesRequest):
     infer_from = PythonLambdaHandlerDependencyInferenceFieldSet
 
 
+# Immutable, so a single instance can be returned for every target with nothing inferred.
+_NO_INFERRED_DEPENDENCIES = InferredDependencies([])
+
+
 @rule(desc="Inferring dependency from the python_awslambda `handler` field")
 async def infer_lambda_handler_dependency(
     request: InferPythonLambdaHandlerDependency,
@@ -172,15 +207,25 @@ async def infer_lambda_handler_dependency(
     python_setup: PythonSetup,
 ) -> InferredDependencies:
     if not python_infer_subsystem.entry_points:
-        return InferredDependencies([])
-    explicitly_provided_deps, handler = await MultiGet(
-        Get(ExplicitlyProvidedDependencies, DependenciesRequest(request.field_set.dependencies)),
-        Get(
-            ResolvedPythonAwsHandler,
-            ResolvePythonAwsHandlerRequest(request.field_set.handler),
-        ),
+        return _NO_INFERRED_DEPENDENCIES
+    explicitly_provided_deps_get = Get(
+        ExplicitlyProvidedDependencies, DependenciesRequest(request.field_set.dependencies)
     )
-    module, _, _func = handler.val.partition(":")
+    handler_val = request.field_set.handler.value
+    module = handler_val[: handler_val.find(":")]
+    if module.endswith(".py"):
+        explicitly_provided_deps, handler = await MultiGet(
+            explicitly_provided_deps_get,
+            Get(
+                ResolvedPythonAwsHandler,
+                ResolvePythonAwsHandlerRequest(request.field_set.handler),
+            ),
+        )
+        module = handler.val[: handler.val.find(":")]
+    else:
+        # The handler is already a module, so there is nothing for the engine to resolve.
+        explicitly_provided_deps = await explicitly_provided_deps_get
+        handler = ResolvedPythonAwsHandler(handler_val, file_name_used=False)
 
     # Only set locality if needed, to avoid unnecessary rule graph memoization misses.
     # When set, use the source root, which is useful in practice, but incurs fewer memoization
@@ -222,36 +267,42 @@ async def infer_lambda_handler_dependency(
     unambiguous_owners = owners.unambiguous or (
         (maybe_disambiguated,) if maybe_disambiguated else ()
     )
+    if not unambiguous_owners:
+        return _NO_INFERRED_DEPENDENCIES
     return InferredDependencies(unambiguous_owners)
 
 
 class PythonAwsLambdaIncludeRequirements(BoolField):
     alias = "include_requirements"
     default = True
-    help = softwrap(
-        """
-        Whether to resolve requirements and include them in the Pex. This is most useful with Lambda
-        Layers to make code uploads smaller when deps are in layers.
-        https://docs.aws.amazon.com/lambda/latest/dg/configuration-layers.html
-        """
+    help = lazy_help(
+        lambda: softwrap(
+            """
+            Whether to resolve requirements and include them in the Pex. This is most useful with
+            Lambda Layers to make code uploads smaller when deps are in layers.
+            https://docs.aws.amazon.com/lambda/latest/dg/configuration-layers.html
+            """
+        )
     )
 
 
 class PythonAwsLambdaRuntime(StringField):
-    PYTHON_RUNTIME_REGEX = r"python(?P<major>\d)\.(?P<minor>\d+)"
+    PYTHON_RUNTIME_REGEX = re.compile(r"python(?P<major>\d)\.(?P<minor>\d+)")
 
     alias = "runtime"
     default = None
-    help = softwrap(
-        """
-        The identifier of the AWS Lambda runtime to target (pythonX.Y).
-        See https://docs.aws.amazon.com/lambda/latest/dg/lambda-python.html.
-
-        In general you'll want to define either a `runtime` or one `complete_platforms` but not
-        both. Specifying a `runtime` is simpler, but less accurate. If you have issues either
-        packaging the AWS Lambda PEX or running it as a deployed AWS Lambda function, you should try
-        using `complete_platforms` instead.
-        """
+    help = lazy_help(
+        lambda: softwrap(
+            """
+            The identifier of the AWS Lambda runtime to target (pythonX.Y).
+            See https://docs.aws.amazon.com/lambda/latest/dg/lambda-python.html.
+
+            In general you'll want to define either a `runtime` or one `complete_platforms` but not
+            both. Specifying a `runtime` is simpler, but less accurate. If you have issues either
+            packaging the AWS Lambda PEX or running it as a deployed AWS Lambda function, you should
+            try using `complete_platforms` instead.
+            """
+        )
     )
 
     @classmethod
@@ -259,7 +310,7 @@ class PythonAwsLambdaRuntime(StringField):
         value = super().compute_value(raw_value, address)
         if value is None:
             return None
-        if not re.match(cls.PYTHON_RUNTIME_REGEX, value):
+        if not cls.PYTHON_RUNTIME_REGEX.fullmatch(value):
             raise InvalidFieldException(
                 softwrap(
                     f"""
@@ -274,19 +325,23 @@ class PythonAwsLambdaRuntime(StringField):
         """Returns the Python version implied by the runtime, as (major, minor)."""
         if self.value is None:
             return None
-        mo = cast(Match, re.match(self.PYTHON_RUNTIME_REGEX, self.value))
-        return int(mo.group("major")), int(mo.group("minor"))
+        mo = self.PYTHON_RUNTIME_REGEX.fullmatch(self.value)
+        assert mo is not None  # Validated in `compute_value`.
+        major, minor = mo.groups()
+        return int(major), int(minor)
 
 
 class PythonAwsLambdaCompletePlatforms(PexCompletePlatformsField):
-    help = softwrap(
-        f"""
-        {PexCompletePlatformsField.help}
-
-        N.B.: If specifying `complete_platforms` to work around packaging failures encountered when
-        using the `runtime` field, ensure you delete the `runtime` field from your
-        `python_awslambda` target.
-        """
+    help = lazy_help(
+        lambda: softwrap(
+            f"""
+            {PexCompletePlatformsField.help}
+
+            N.B.: If specifying `complete_platforms` to work around packaging failures encountered
+            when using the `runtime` field, ensure you delete the `runtime` field from your
+            `python_awslambda` target.
+            """
+        )
     )
 
 
@@ -302,12 +357,14 @@ class PythonAWSLambda(Target):
         PythonAwsLambdaCompletePlatforms,
         PythonResolveField,
     )
-    help = softwrap(
-        f"""
-        A self-contained Python function suitable for uploading to AWS Lambda.
+    help = lazy_help(
+        lambda: softwrap(
+            f"""
+            A self-contained Python function suitable for uploading to AWS Lambda.
 
-        See {doc_url('awslambda-python')}.
-        """
+            See {doc_url('awslambda-python')}.
+            """
+        )
     )
 
     def validate(self) -> None:
@@ -8,6 +8,8 @@ import pytest
 
 from pants.backend.awslambda.python.target_types import (
     InferPythonLambdaHandlerDependency,
+    PythonAwsHandlerModule,
+    PythonAwsHandlerModuleRequest,
     PythonAWSLambda,
     PythonAwsLambdaCompletePlatforms,
     PythonAwsLambdaHandlerField,
@@ -34,6 +36,7 @@ def rule_runner() -> RuleRunner:
             *target_type_rules(),
             *python_target_types_rules(),
             QueryRule(ResolvedPythonAwsHandler, [ResolvePythonAwsHandlerRequest]),
+            QueryRule(PythonAwsHandlerModule, [PythonAwsHandlerModuleRequest]),
             QueryRule(InferredDependencies, [InferPythonLambdaHandlerDependency]),
         ],
         target_types=[
@@ -62,7 +65,7 @@ def test_to_interpreter_version(runtime: str, expected_major: int, expected_mino
     ).to_interpreter_version()
 
 
-@pytest.mark.parametrize("invalid_runtime", ("python88.99", "fooobar"))
+@pytest.mark.parametrize("invalid_runtime", ("python88.99", "fooobar", "python3.8garbage"))
 def test_runtime_validation(invalid_runtime: str) -> None:
     with pytest.raises(InvalidFieldException):
         PythonAwsLambdaRuntime(invalid_runtime, Address("", target_name="t"))
@@ -106,6 +109,19 @@ def test_resolve_handler(rule_runner: RuleRunner) -> None:
         assert_resolved("*.py:func", expected="doesnt matter", is_file=True)
 
 
+def test_resolve_handler_module(rule_runner: RuleRunner) -> None:
+    rule_runner.write_files(
+        {"src/python/project/lambda.py": "", "src/python/project/nested/f2.py": ""}
+    )
+
+    def assert_module(path: str, expected: str) -> None:
+        result = rule_runner.request(PythonAwsHandlerModule, [PythonAwsHandlerModuleRequest(path)])
+        assert result.module == expected
+
+    assert_module("src/python/project/lambda.py", "project.lambda")
+    assert_module("src/python/project/nested/f2.py", "project.nested.f2")
+
+
 def test_infer_handler_dependency(rule_runner: RuleRunner, caplog) -> None:
     rule_runner.write_files(
         {
@@ -6,6 +6,7 @@ from __future__ import annotations
 import logging
 import os
 
+from pants.engine.env_vars import EnvironmentVarsRequest
 from pants.option.option_types import BoolOption, StrListOption, StrOption
 from pants.option.subsystem import Subsystem
 from pants.util.memo import memoized_property
@@ -168,10 +169,15 @@ class GolangSubsystem(Subsystem):
         def raw_go_search_paths(self) -> tuple[str, ...]:
             return tuple(self._go_search_paths)
 
-        @property
+        @memoized_property
         def env_vars_to_pass_to_subprocesses(self) -> tuple[str, ...]:
             return tuple(sorted(set(self._subprocess_env_vars)))
 
+        @memoized_property
+        def env_vars_request(self) -> EnvironmentVarsRequest:
+            """The request for `env_vars_to_pass_to_subprocesses`, shared by every Go process."""
+            return EnvironmentVarsRequest(self.env_vars_to_pass_to_subprocesses)
+
         @memoized_property
         def cgo_tool_search_paths(self) -> tuple[str, ...]:
             def iter_path_entries():
@@ -28,7 +28,13 @@ from pants.backend.go.util_rules.coverage import (
 from pants.backend.go.util_rules.embedcfg import EmbedConfig
 from pants.backend.go.util_rules.goroot import GoRoot
 from pants.backend.go.util_rules.import_analysis import ImportConfig, ImportConfigRequest
-from pants.backend.go.util_rules.sdk import GoSdkProcess, GoSdkToolIDRequest, GoSdkToolIDResult
+from pants.backend.go.util_rules.sdk import (
+    GoSdkProcess,
+    GoSdkToolIDRequest,
+    GoSdkToolIDResult,
+    GoSdkToolIDs,
+    GoSdkToolIDsRequest,
+)
 from pants.base.glob_match_error_behavior import GlobMatchErrorBehavior
 from pants.engine.engine_aware import EngineAwareParameter, EngineAwareReturnType
 from pants.engine.fs import (
@@ -958,12 +964,14 @@ async def compute_compile_action_id(
     # TODO: Inject cover mode values here.
     # TODO: Inject fuzz instrumentation values here.
 
-    compile_tool_id = await Get(GoSdkToolIDResult, GoSdkToolIDRequest("compile"))
-    h.update(f"compile {compile_tool_id.tool_id}\n".encode())
+    tool_ids = await Get(
+        GoSdkToolIDs,
+        GoSdkToolIDsRequest(frozenset(("compile", "asm") if bq.s_files else ("compile",))),
+    )
+    h.update(f"compile {tool_ids['compile']}\n".encode())
     # TODO: Add compiler flags as per `go`'s algorithm. Need to figure out
     if bq.s_files:
-        asm_tool_id = await Get(GoSdkToolIDResult, GoSdkToolIDRequest("asm"))
-        h.update(f"asm {asm_tool_id.tool_id}\n".encode())
+        h.update(f"asm {tool_ids['asm']}\n".encode())
         # TODO: Add asm flags as per `go`'s algorithm.
     # TODO: Add micro-architecture into cache key (e.g., GOAMD64 setting).
     if "GOEXPERIMENT" in goroot._raw_metadata:
@@ -348,10 +348,7 @@ async def _cc(
     wrapper_script = await Get(CGoCompilerWrapperScript, CGoCompilerWrapperScriptRequest())
     compiler_args_result, env, input_digest = await MultiGet(
         Get(SetupCompilerCmdResult, SetupCompilerCmdRequest((compiler_path.path,), dir_path)),
-        Get(
-            EnvironmentVars,
-            EnvironmentVarsRequest(golang_env_aware.env_vars_to_pass_to_subprocesses),
-        ),
+        Get(EnvironmentVars, EnvironmentVarsRequest, golang_env_aware.env_vars_request),
         Get(Digest, MergeDigests([input_digest, wrapper_script.digest])),
     )
     replaced_flags = _replace_srcdir_in_flags(flags, dir_path)
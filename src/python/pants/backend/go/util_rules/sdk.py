@@ -6,22 +6,58 @@ from __future__ import annotations
 import textwrap
 from dataclasses import dataclass
 from typing import Iterable, Mapping
+from weakref import WeakValueDictionary
 
 from pants.backend.go.subsystems.golang import GolangSubsystem
 from pants.backend.go.util_rules import goroot
 from pants.backend.go.util_rules.goroot import GoRoot
 from pants.core.util_rules.system_binaries import BashBinary
 from pants.engine.env_vars import EnvironmentVars, EnvironmentVarsRequest
-from pants.engine.fs import EMPTY_DIGEST, CreateDigest, Digest, FileContent, MergeDigests
+from pants.engine.fs import EMPTY_DIGEST, CreateDigest, Digest, Directory, FileContent, MergeDigests
 from pants.engine.internals.selectors import Get, MultiGet
 from pants.engine.process import Process, ProcessResult
 from pants.engine.rules import collect_rules, rule
 from pants.util.frozendict import FrozenDict
 from pants.util.logging import LogLevel
+from pants.util.memo import memoized
+
+# Most Go invocations use one of a handful of distinct environments, so share the `FrozenDict`
+# instances between `GoSdkProcess`es rather than building and hashing an identical one each time.
+_GO_SDK_PROCESS_ENVS: WeakValueDictionary[
+    tuple[bool, tuple[tuple[str, str], ...]], FrozenDict[str, str]
+] = WeakValueDictionary()
+# The most common environments are kept alive permanently.
+_EMPTY_ENV: FrozenDict[str, str] = FrozenDict()
+_GOPROXY_OFF_ENV = FrozenDict({"GOPROXY": "off"})
+
+
+def _go_sdk_process_env(
+    env: Mapping[str, str] | None, allow_downloads: bool
+) -> FrozenDict[str, str]:
+    if not env:
+        return _EMPTY_ENV if allow_downloads else _GOPROXY_OFF_ENV
+    key = (allow_downloads, tuple(env.items()))
+    frozen_env = _GO_SDK_PROCESS_ENVS.get(key)
+    if frozen_env is None:
+        frozen_env = FrozenDict(env) if allow_downloads else FrozenDict({**env, "GOPROXY": "off"})
+        _GO_SDK_PROCESS_ENVS[key] = frozen_env
+    return frozen_env
 
 
 @dataclass(frozen=True)
 class GoSdkProcess:
+    __slots__ = (
+        "command",
+        "description",
+        "env",
+        "input_digest",
+        "working_dir",
+        "output_files",
+        "output_directories",
+        "replace_sandbox_root_in_args",
+        "_hashcode",
+    )  # don't use a `dict` to store attrs, since one of these is built for every Go invocation
+
     command: tuple[str, ...]
     description: str
     env: FrozenDict[str, str]
@@ -46,20 +82,32 @@ class GoSdkProcess:
     ) -> None:
         object.__setattr__(self, "command", tuple(command))
         object.__setattr__(self, "description", description)
-        object.__setattr__(
-            self,
-            "env",
-            (
-                FrozenDict(env or {})
-                if allow_downloads
-                else FrozenDict({**(env or {}), "GOPROXY": "off"})
-            ),
-        )
+        object.__setattr__(self, "env", _go_sdk_process_env(env, allow_downloads))
         object.__setattr__(self, "input_digest", input_digest)
         object.__setattr__(self, "working_dir", working_dir)
         object.__setattr__(self, "output_files", tuple(output_files))
         object.__setattr__(self, "output_directories", tuple(output_directories))
         object.__setattr__(self, "replace_sandbox_root_in_args", replace_sandbox_root_in_args)
+        # NB: The engine hashes these repeatedly as memoization keys, so compute the hash once.
+        object.__setattr__(
+            self,
+            "_hashcode",
+            hash(
+                (
+                    self.command,
+                    self.description,
+                    self.env,
+                    self.input_digest,
+                    self.working_dir,
+                    self.output_files,
+                    self.output_directories,
+                    self.replace_sandbox_root_in_args,
+                )
+            ),
+        )
+
+    def __hash__(self) -> int:
+        return self._hashcode
 
 
 @dataclass(frozen=True)
@@ -71,34 +119,47 @@ class GoSdkRunSetup:
     SANDBOX_ROOT_ENV = "__PANTS_REPLACE_SANDBOX_ROOT"
 
 
+# Note: The `go` tool requires GOPATH to be an absolute path which can only be resolved
+# from within the execution sandbox. Thus, this code uses a bash script to be able to resolve
+# absolute paths inside the sandbox.
+#
+# The engine's native `{chroot}` substitution in argv and env is not a replacement for this script:
+# it is only applied by the local and Docker process runners, not by remote execution.
+_GO_RUN_SCRIPT_TEMPLATE = textwrap.dedent(
+    """\
+    export GOROOT={goroot_path}
+    sandbox_root="$(/bin/pwd)"
+    export GOPATH="${{sandbox_root}}/gopath"
+    export GOCACHE="${{sandbox_root}}/cache"
+    if [ -n "${chdir_env}" ]; then
+      cd "${chdir_env}"
+    fi
+    if [ -n "${sandbox_root_env}" ]; then
+      export __PANTS_SANDBOX_ROOT__="$sandbox_root"
+      args=("${{@//__PANTS_SANDBOX_ROOT__/$sandbox_root}}")
+      set -- "${{args[@]}}"
+    fi
+    exec "{goroot_path}/bin/go" "$@"
+    """
+)
+
+
 @rule
 async def go_sdk_invoke_setup(goroot: GoRoot) -> GoSdkRunSetup:
-    # Note: The `go` tool requires GOPATH to be an absolute path which can only be resolved
-    # from within the execution sandbox. Thus, this code uses a bash script to be able to resolve
-    # absolute paths inside the sandbox.
     go_run_script = FileContent(
         "__run_go.sh",
-        textwrap.dedent(
-            f"""\
-            export GOROOT={goroot.path}
-            sandbox_root="$(/bin/pwd)"
-            export GOPATH="${{sandbox_root}}/gopath"
-            export GOCACHE="${{sandbox_root}}/cache"
-            /bin/mkdir -p "$GOPATH" "$GOCACHE"
-            if [ -n "${GoSdkRunSetup.CHDIR_ENV}" ]; then
-              cd "${GoSdkRunSetup.CHDIR_ENV}"
-            fi
-            if [ -n "${GoSdkRunSetup.SANDBOX_ROOT_ENV}" ]; then
-              export __PANTS_SANDBOX_ROOT__="$sandbox_root"
-              args=("${{@//__PANTS_SANDBOX_ROOT__/$sandbox_root}}")
-              set -- "${{args[@]}}"
-            fi
-            exec "{goroot.path}/bin/go" "$@"
-            """
+        _GO_RUN_SCRIPT_TEMPLATE.format(
+            goroot_path=goroot.path,
+            chdir_env=GoSdkRunSetup.CHDIR_ENV,
+            sandbox_root_env=GoSdkRunSetup.SANDBOX_ROOT_ENV,
         ).encode("utf-8"),
     )
 
-    digest = await Get(Digest, CreateDigest([go_run_script]))
+    # Create GOPATH and GOCACHE as part of the input digest, rather than forking `mkdir` in the
+    # script on every invocation.
+    digest = await Get(
+        Digest, CreateDigest([go_run_script, Directory("gopath"), Directory("cache")])
+    )
     return GoSdkRunSetup(digest, go_run_script)
 
 
@@ -110,13 +171,16 @@ async def setup_go_sdk_process(
     golang_env_aware: GolangSubsystem.EnvironmentAware,
     goroot: GoRoot,
 ) -> Process:
-    input_digest, env_vars = await MultiGet(
-        Get(Digest, MergeDigests([go_sdk_run.digest, request.input_digest])),
-        Get(
-            EnvironmentVars,
-            EnvironmentVarsRequest(golang_env_aware.env_vars_to_pass_to_subprocesses),
-        ),
-    )
+    env_vars_get = Get(EnvironmentVars, EnvironmentVarsRequest, golang_env_aware.env_vars_request)
+    if request.input_digest == EMPTY_DIGEST:
+        # E.g. tool ID probes, which only need the SDK itself.
+        input_digest = go_sdk_run.digest
+        env_vars = await env_vars_get
+    else:
+        input_digest, env_vars = await MultiGet(
+            Get(Digest, MergeDigests([go_sdk_run.digest, request.input_digest])),
+            env_vars_get,
+        )
     maybe_replace_sandbox_root_env = (
         {GoSdkRunSetup.SANDBOX_ROOT_ENV: "1"} if request.replace_sandbox_root_in_args else {}
     )
@@ -149,17 +213,42 @@ class GoSdkToolIDResult:
     tool_id: str
 
 
+@memoized
+def _go_tool_id_process(tool_name: str) -> GoSdkProcess:
+    return GoSdkProcess(
+        ["tool", tool_name, "-V=full"],
+        description=f"Obtain tool ID for Go tool `{tool_name}`.",
+    )
+
+
 @rule
 async def compute_go_tool_id(request: GoSdkToolIDRequest) -> GoSdkToolIDResult:
-    result = await Get(
-        ProcessResult,
-        GoSdkProcess(
-            ["tool", request.tool_name, "-V=full"],
-            description=f"Obtain tool ID for Go tool `{request.tool_name}`.",
-        ),
-    )
+    result = await Get(ProcessResult, GoSdkProcess, _go_tool_id_process(request.tool_name))
     return GoSdkToolIDResult(tool_name=request.tool_name, tool_id=result.stdout.decode().strip())
 
 
+@dataclass(frozen=True)
+class GoSdkToolIDsRequest:
+    """Request the tool IDs of several Go tools at once, so that their probes run concurrently."""
+
+    tool_names: frozenset[str]
+
+
+@dataclass(frozen=True)
+class GoSdkToolIDs:
+    tool_ids: FrozenDict[str, str]
+
+    def __getitem__(self, tool_name: str) -> str:
+        return self.tool_ids[tool_name]
+
+
+@rule
+async def compute_go_tool_ids(request: GoSdkToolIDsRequest) -> GoSdkToolIDs:
+    results = await MultiGet(
+        Get(GoSdkToolIDResult, GoSdkToolIDRequest(tool_name)) for tool_name in request.tool_names
+    )
+    return GoSdkToolIDs(FrozenDict((result.tool_name, result.tool_id) for result in results))
+
+
 def rules():
     return (*collect_rules(), *goroot.rules())
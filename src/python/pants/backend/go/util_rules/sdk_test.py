@@ -0,0 +1,41 @@
+# Copyright 2023 Pants project contributors (see CONTRIBUTORS.md).
+# Licensed under the Apache License, Version 2.0 (see LICENSE).
+from __future__ import annotations
+
+from pants.backend.go.util_rules.sdk import _EMPTY_ENV, _GOPROXY_OFF_ENV, _go_sdk_process_env
+from pants.util.frozendict import FrozenDict
+
+
+def test_go_sdk_process_env_without_env() -> None:
+    assert _go_sdk_process_env(None, allow_downloads=True) is _EMPTY_ENV
+    assert _go_sdk_process_env({}, allow_downloads=True) is _EMPTY_ENV
+    assert _go_sdk_process_env(None, allow_downloads=False) is _GOPROXY_OFF_ENV
+    assert _go_sdk_process_env({}, allow_downloads=False) is _GOPROXY_OFF_ENV
+    assert _EMPTY_ENV == FrozenDict()
+    assert _GOPROXY_OFF_ENV == FrozenDict({"GOPROXY": "off"})
+
+
+def test_go_sdk_process_env_disallows_downloads() -> None:
+    assert _go_sdk_process_env({"CGO_ENABLED": "1"}, allow_downloads=False) == FrozenDict(
+        {"CGO_ENABLED": "1", "GOPROXY": "off"}
+    )
+    # A caller-supplied `GOPROXY` must not re-enable downloads.
+    assert _go_sdk_process_env(
+        {"GOPROXY": "https://proxy.golang.org"}, allow_downloads=False
+    ) == FrozenDict({"GOPROXY": "off"})
+    assert _go_sdk_process_env(
+        {"GOPROXY": "https://proxy.golang.org"}, allow_downloads=True
+    ) == FrozenDict({"GOPROXY": "https://proxy.golang.org"})
+
+
+def test_go_sdk_process_env_is_shared() -> None:
+    env = _go_sdk_process_env({"CGO_ENABLED": "1"}, allow_downloads=True)
+    assert env == FrozenDict({"CGO_ENABLED": "1"})
+    assert _go_sdk_process_env({"CGO_ENABLED": "1"}, allow_downloads=True) is env
+
+    disallowed_env = _go_sdk_process_env({"CGO_ENABLED": "1"}, allow_downloads=False)
+    assert disallowed_env is not env
+    assert disallowed_env == FrozenDict({"CGO_ENABLED": "1", "GOPROXY": "off"})
+    assert _go_sdk_process_env({"CGO_ENABLED": "1"}, allow_downloads=False) is disallowed_env
+    # The earlier entry is not clobbered by the one for the other `allow_downloads` value.
+    assert _go_sdk_process_env({"CGO_ENABLED": "1"}, allow_downloads=True) is env
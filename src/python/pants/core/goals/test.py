@@ -6,10 +6,11 @@ from __future__ import annotations
 import itertools
 import logging
 from abc import ABC, ABCMeta
-from dataclasses import dataclass
+from collections import defaultdict
+from dataclasses import dataclass, field
 from enum import Enum
 from pathlib import PurePath
-from typing import Any, ClassVar, Iterable, Optional, TypeVar, cast
+from typing import Any, ClassVar, Iterable, Mapping, Optional, TypeVar, cast
 
 from pants.core.goals.multi_tool_goal_helper import SkippableSubsystem
 from pants.core.goals.package import BuiltPackage, PackageFieldSet
@@ -95,10 +96,34 @@ class TestResult(EngineAwareReturnType):
     extra_output: Snapshot | None = None
     # True if the core test rules should log that extra output was written.
     log_extra_output: bool = False
+    # See `description`. Computed once, since it is used by both the sort key and the summary.
+    _description: str = field(init=False, repr=False, compare=False, hash=False)
+    # See `__lt__`. Computed once, since results are sorted for the summary.
+    _sort_key: tuple[bool, int, str] = field(init=False, repr=False, compare=False, hash=False)
 
     # Prevent this class from being detected by pytest as a test class.
     __test__ = False
 
+    def __post_init__(self) -> None:
+        if not self.addresses:
+            # NB: This is eagerly computed, so don't fail construction of a result that a plugin
+            # built without any addresses.
+            description = ""
+        elif len(self.addresses) == 1:
+            description = self.addresses[0].spec
+        else:
+            description = f"{self.addresses[0].spec} and {len(self.addresses)-1} other files"
+        object.__setattr__(self, "_description", description)
+        object.__setattr__(
+            self,
+            "_sort_key",
+            (
+                self.exit_code is not None,
+                abs(self.exit_code) if self.exit_code is not None else 0,
+                description,
+            ),
+        )
+
     @staticmethod
     def no_tests_found(address: Address, output_setting: ShowOutput) -> TestResult:
         """Used when we do test discovery ourselves, and we didn't find any."""
@@ -143,9 +168,9 @@ class TestResult(EngineAwareReturnType):
     ) -> TestResult:
         return TestResult(
             exit_code=process_result.exit_code,
-            stdout=process_result.stdout.decode(),
+            stdout=process_result.stdout.decode("utf-8", "replace"),
             stdout_digest=process_result.stdout_digest,
-            stderr=process_result.stderr.decode(),
+            stderr=process_result.stderr.decode("utf-8", "replace"),
             stderr_digest=process_result.stderr_digest,
             addresses=(address,),
             output_setting=output_setting,
@@ -169,9 +194,9 @@ class TestResult(EngineAwareReturnType):
     ) -> TestResult:
         return TestResult(
             exit_code=process_result.exit_code,
-            stdout=process_result.stdout.decode(),
+            stdout=process_result.stdout.decode("utf-8", "replace"),
             stdout_digest=process_result.stdout_digest,
-            stderr=process_result.stderr.decode(),
+            stderr=process_result.stderr.decode("utf-8", "replace"),
             stderr_digest=process_result.stderr_digest,
             addresses=tuple(field_set.address for field_set in batch.elements),
             output_setting=output_setting,
@@ -185,10 +210,7 @@ class TestResult(EngineAwareReturnType):
 
     @property
     def description(self) -> str:
-        if len(self.addresses) == 1:
-            return self.addresses[0].spec
-
-        return f"{self.addresses[0].spec} and {len(self.addresses)-1} other files"
+        return self._description
 
     @property
     def path_safe_description(self) -> str:
@@ -198,16 +220,10 @@ class TestResult(EngineAwareReturnType):
         return f"{self.addresses[0].path_safe_spec}+{len(self.addresses)-1}"
 
     def __lt__(self, other: Any) -> bool:
-        """We sort first by exit code, then alphanumerically within each group."""
+        """We sort first by exit code magnitude, then alphanumerically within each group."""
         if not isinstance(other, TestResult):
             return NotImplemented
-        if self.exit_code == other.exit_code:
-            return self.description < other.description
-        if self.exit_code is None:
-            return True
-        if other.exit_code is None:
-            return False
-        return abs(self.exit_code) < abs(other.exit_code)
+        return self._sort_key < other._sort_key
 
     def artifacts(self) -> dict[str, FileDigest | Snapshot] | None:
         output: dict[str, FileDigest | Snapshot] = {
@@ -227,21 +243,23 @@ class TestResult(EngineAwareReturnType):
         if self.exit_code is None:
             return "no tests found."
         status = "succeeded" if self.exit_code == 0 else f"failed (exit code {self.exit_code})"
-        message = f"{status}."
-        if self.partition_description:
-            message += f"\nPartition: {self.partition_description}"
+        message = (
+            f"{status}.\nPartition: {self.partition_description}"
+            if self.partition_description
+            else f"{status}."
+        )
         if self.output_setting == ShowOutput.NONE or (
             self.output_setting == ShowOutput.FAILED and self.exit_code == 0
         ):
             return message
-        output = ""
+        output: list[str] = []
         if self.stdout:
-            output += f"\n{self.stdout}"
+            output.extend(("\n", self.stdout))
         if self.stderr:
-            output += f"\n{self.stderr}"
-        if output:
-            output = f"{output.rstrip()}\n\n"
-        return f"{message}{output}"
+            output.extend(("\n", self.stderr))
+        if not output:
+            return message
+        return f"{message}{''.join(output).rstrip()}\n\n"
 
     def metadata(self) -> dict[str, Any]:
         return {"addresses": [address.spec for address in self.addresses]}
@@ -461,21 +479,12 @@ class CoverageReports(EngineAwareReturnType):
         return any(report.coverage_insufficient for report in self.reports)
 
     def materialize(self, console: Console, workspace: Workspace) -> tuple[PurePath, ...]:
-        report_paths = []
-        for report in self.reports:
-            report_path = report.materialize(console, workspace)
-            if report_path:
-                report_paths.append(report_path)
-        return tuple(report_paths)
+        report_paths = (report.materialize(console, workspace) for report in self.reports)
+        return tuple(report_path for report_path in report_paths if report_path)
 
     def artifacts(self) -> dict[str, Snapshot | FileDigest] | None:
-        artifacts: dict[str, Snapshot | FileDigest] = {}
-        for report in self.reports:
-            artifact = report.get_artifact()
-            if not artifact:
-                continue
-            artifacts[artifact[0]] = artifact[1]
-        return artifacts or None
+        artifacts = (report.get_artifact() for report in self.reports)
+        return {name: artifact for name, artifact in filter(None, artifacts)} or None
 
 
 class TestSubsystem(GoalSubsystem):
@@ -731,6 +740,26 @@ async def _get_test_batches(
     ]
 
 
+@dataclass(frozen=True)
+class RunTestBatchRequest:
+    """Run a batch of tests in the environment chosen for its field sets."""
+
+    batch: TestRequest.Batch
+
+
+@rule
+async def run_test_batch(request: RunTestBatchRequest) -> TestResult:
+    # NB: Choosing the environment and running the tests in a single rule means that each batch
+    # starts as soon as its own environment is known, rather than after every batch's is.
+    batch = request.batch
+    environment_name = await Get(
+        EnvironmentName,
+        SingleEnvironmentNameRequest,
+        SingleEnvironmentNameRequest.from_field_sets(batch.elements, batch.description),
+    )
+    return await Get(TestResult, {batch: TestRequest.Batch, environment_name: EnvironmentName})
+
+
 @rule_helper
 async def _run_debug_tests(
     batches: Iterable[TestRequest.Batch],
@@ -754,6 +783,8 @@ async def _run_debug_tests(
         )
         for batch in batches
     )
+    # NB: The debug processes are deliberately run one at a time, rather than concurrently: each is
+    # interactive, and so needs exclusive use of the terminal (e.g. to stop at breakpoints).
     exit_code = 0
     for debug_request in debug_requests:
         if test_subsystem.debug_adapter:
@@ -824,35 +855,24 @@ async def run_tests(
             test_batches, test_subsystem, debug_adapter, local_environment_name
         )
 
-    environment_names = await MultiGet(
-        Get(
-            EnvironmentName,
-            SingleEnvironmentNameRequest,
-            SingleEnvironmentNameRequest.from_field_sets(batch.elements, batch.description),
-        )
-        for batch in test_batches
-    )
-
-    results = await MultiGet(
-        Get(TestResult, {batch: TestRequest.Batch, environment_name: EnvironmentName})
-        for batch, environment_name in zip(test_batches, environment_names)
-    )
+    results = await MultiGet(Get(TestResult, RunTestBatchRequest(batch)) for batch in test_batches)
 
     # Print summary.
     exit_code = 0
     if results:
         console.print_stderr("")
-    for result in sorted(results):
-        if result.exit_code is None:
-            # We end up here, e.g., if we implemented test discovery and found no tests.
-            continue
+    # NB: Results without an exit code are dropped before sorting rather than while iterating. We
+    # end up with those, e.g., if we implemented test discovery and found no tests.
+    ran_results = [result for result in results if result.exit_code is not None]
+    summary_statuses = _test_summary_statuses(console)
+    for result in sorted(ran_results):
         if result.exit_code != 0:
             exit_code = result.exit_code
         if result.result_metadata is None:
             # We end up here, e.g., if compilation failed during self-implemented test discovery.
             continue
 
-        console.print_stderr(_format_test_summary(result, run_id, console))
+        console.print_stderr(_format_test_summary(result, run_id, summary_statuses))
 
         if result.extra_output and result.extra_output.files:
             path_prefix = str(distdir.relpath / "test" / result.path_safe_description)
@@ -874,22 +894,24 @@ async def run_tests(
         workspace.write_digest(merged_reports, path_prefix=str(report_dir))
         console.print_stderr(f"\nWrote test reports to {report_dir}")
 
+    coverage_data_by_type: dict[type[CoverageData], list[CoverageData]] = defaultdict(list)
     if test_subsystem.use_coverage:
-        # NB: We must pre-sort the data for itertools.groupby() to work properly, using the same
-        # key function for both. However, you can't sort by `types`, so we call `str()` on it.
-        all_coverage_data = sorted(
-            (result.coverage_data for result in results if result.coverage_data is not None),
-            key=lambda cov_data: str(type(cov_data)),
-        )
-
+        for result in results:
+            if result.coverage_data is not None:
+                coverage_data_by_type[type(result.coverage_data)].append(result.coverage_data)
+
+    coverage_reports_collections: tuple[CoverageReports, ...] = ()
+    # NB: Even with coverage enabled, no test may have produced coverage data, in which case
+    # there are no reports to generate.
+    if coverage_data_by_type:
         coverage_types_to_collection_types = {
             collection_cls.element_type: collection_cls  # type: ignore[misc]
             for collection_cls in union_membership.get(CoverageDataCollection)
         }
-        coverage_collections = []
-        for data_cls, data in itertools.groupby(all_coverage_data, lambda data: type(data)):
-            collection_cls = coverage_types_to_collection_types[data_cls]
-            coverage_collections.append(collection_cls(data))
+        coverage_collections = [
+            coverage_types_to_collection_types[data_cls](data)
+            for data_cls, data in coverage_data_by_type.items()
+        ]
         # We can create multiple reports for each coverage data (e.g., console, xml, html)
         coverage_reports_collections = await MultiGet(
             Get(
@@ -902,10 +924,13 @@ async def run_tests(
             for coverage_collection in coverage_collections
         )
 
-        coverage_report_files: list[PurePath] = []
-        for coverage_reports in coverage_reports_collections:
-            report_files = coverage_reports.materialize(console, workspace)
-            coverage_report_files.extend(report_files)
+    if coverage_reports_collections:
+        coverage_report_files = tuple(
+            itertools.chain.from_iterable(
+                coverage_reports.materialize(console, workspace)
+                for coverage_reports in coverage_reports_collections
+            )
+        )
 
         if coverage_report_files and test_subsystem.open_coverage:
             open_files = await Get(
@@ -942,17 +967,26 @@ _SOURCE_MAP = {
 }
 
 
-def _format_test_summary(result: TestResult, run_id: RunId, console: Console) -> str:
+def _test_summary_statuses(console: Console) -> dict[bool, tuple[str, str]]:
+    """The `(sigil, status)` to print for a result, keyed by whether it succeeded.
+
+    The sigils only depend on the console, so they are formatted once per summary rather than once
+    per result.
+    """
+    return {
+        True: (console.sigil_succeeded(), "succeeded"),
+        False: (console.sigil_failed(), "failed"),
+    }
+
+
+def _format_test_summary(
+    result: TestResult, run_id: RunId, statuses: Mapping[bool, tuple[str, str]]
+) -> str:
     """Format the test summary printed to the console."""
     assert (
         result.result_metadata is not None
     ), "Skipped test results should not be outputted in the test summary"
-    if result.exit_code == 0:
-        sigil = console.sigil_succeeded()
-        status = "succeeded"
-    else:
-        sigil = console.sigil_failed()
-        status = "failed"
+    sigil, status = statuses[result.exit_code == 0]
 
     source = _SOURCE_MAP.get(result.result_metadata.source(run_id))
     source_print = f" ({source})" if source else ""
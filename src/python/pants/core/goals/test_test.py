@@ -23,6 +23,7 @@ from pants.core.goals.test import (
     CoverageData,
     CoverageDataCollection,
     CoverageReports,
+    RunTestBatchRequest,
     RuntimePackageDependenciesField,
     ShowOutput,
     Test,
@@ -34,7 +35,9 @@ from pants.core.goals.test import (
     TestSubsystem,
     TestTimeoutField,
     _format_test_summary,
+    _test_summary_statuses,
     build_runtime_package_dependencies,
+    run_test_batch,
     run_tests,
 )
 from pants.core.subsystems.debug_adapter import DebugAdapterSubsystem
@@ -57,7 +60,13 @@ from pants.engine.fs import (
     Workspace,
 )
 from pants.engine.internals.session import RunId
-from pants.engine.process import InteractiveProcess, InteractiveProcessResult, ProcessResultMetadata
+from pants.engine.platform import Platform
+from pants.engine.process import (
+    FallibleProcessResult,
+    InteractiveProcess,
+    InteractiveProcessResult,
+    ProcessResultMetadata,
+)
 from pants.engine.target import (
     BoolField,
     MultipleSourcesField,
@@ -302,15 +311,10 @@ def run_test_rule(
                     input_types=(TestRequest.PartitionRequest, EnvironmentName),
                     mock=mock_partitioner,
                 ),
-                MockGet(
-                    output_type=EnvironmentName,
-                    input_types=(SingleEnvironmentNameRequest,),
-                    mock=lambda _a: EnvironmentName(None),
-                ),
                 MockGet(
                     output_type=TestResult,
-                    input_types=(TestRequest.Batch, EnvironmentName),
-                    mock=mock_test_partition,
+                    input_types=(RunTestBatchRequest,),
+                    mock=lambda request: mock_test_partition(request.batch, EnvironmentName(None)),
                 ),
                 MockGet(
                     output_type=TestDebugRequest,
@@ -350,6 +354,36 @@ def run_test_rule(
         return result.exit_code, stdio_reader.get_stderr()
 
 
+def test_run_test_batch() -> None:
+    field_set = MockTestFieldSet.create(make_target())
+    batch = SuccessfulRequest.Batch("", (field_set,), None)
+    environment_name = EnvironmentName("docker")
+
+    def mock_test_batch(request: TestRequest.Batch, env: EnvironmentName) -> TestResult:
+        assert request == batch
+        assert env == environment_name
+        return mock_test_partition(request, env)
+
+    result = run_rule_with_mocks(
+        run_test_batch,
+        rule_args=[RunTestBatchRequest(batch)],
+        mock_gets=[
+            MockGet(
+                output_type=EnvironmentName,
+                input_types=(SingleEnvironmentNameRequest,),
+                mock=lambda _: environment_name,
+            ),
+            MockGet(
+                output_type=TestResult,
+                input_types=(TestRequest.Batch, EnvironmentName),
+                mock=mock_test_batch,
+            ),
+        ],
+    )
+    assert result.exit_code == 0
+    assert result.addresses == (field_set.address,)
+
+
 def test_invalid_target_noops(rule_runner: RuleRunner) -> None:
     exit_code, stderr = run_test_rule(
         rule_runner,
@@ -410,7 +444,7 @@ def _assert_test_summary(
             result_metadata=result_metadata,
         ),
         RunId(run_id),
-        Console(use_colors=False),
+        _test_summary_statuses(Console(use_colors=False)),
     )
 
 
@@ -441,6 +475,39 @@ def test_format_summary_memoized(rule_runner: RuleRunner) -> None:
     )
 
 
+def test_result_without_addresses() -> None:
+    result = TestResult(
+        exit_code=0,
+        stdout="",
+        stderr="",
+        stdout_digest=EMPTY_FILE_DIGEST,
+        stderr_digest=EMPTY_FILE_DIGEST,
+        addresses=(),
+        output_setting=ShowOutput.FAILED,
+        result_metadata=None,
+    )
+    assert result.description == ""
+
+
+def test_result_from_invalid_utf8_output() -> None:
+    result = TestResult.from_fallible_process_result(
+        FallibleProcessResult(
+            exit_code=1,
+            stdout=b"out \xff",
+            stdout_digest=EMPTY_FILE_DIGEST,
+            stderr=b"err \xff",
+            stderr_digest=EMPTY_FILE_DIGEST,
+            output_digest=EMPTY_DIGEST,
+            platform=Platform.create_for_localhost(),
+            metadata=ProcessResultMetadata(0, "ran_locally", 0),
+        ),
+        Address("demo_test"),
+        ShowOutput.ALL,
+    )
+    assert result.stdout == "out \ufffd"
+    assert result.stderr == "err \ufffd"
+
+
 def test_debug_target(rule_runner: RuleRunner) -> None:
     exit_code, _ = run_test_rule(
         rule_runner,
@@ -492,7 +559,7 @@ def test_coverage(rule_runner: RuleRunner) -> None:
     assert stderr.strip().endswith(f"Ran coverage on {addr1.spec}, {addr2.spec}")
 
 
-def sort_results() -> None:
+def test_sort_results() -> None:
     create_test_result = partial(
         TestResult,
         stdout="",
@@ -500,6 +567,7 @@ def sort_results() -> None:
         stderr="",
         stderr_digest=EMPTY_FILE_DIGEST,
         output_setting=ShowOutput.ALL,
+        result_metadata=None,
     )
     skip1 = create_test_result(
         exit_code=None,
@@ -534,6 +602,28 @@ def sort_results() -> None:
         fail2,
     ]
 
+    # Exit codes are compared by magnitude, and results with the same magnitude are ordered by
+    # description rather than by the order they were produced in.
+    negative_fail1 = create_test_result(
+        exit_code=-1,
+        addresses=(Address("t1"),),
+    )
+    assert sorted([fail2, negative_fail1]) == [negative_fail1, fail2]
+    assert sorted([negative_fail1, fail2]) == [negative_fail1, fail2]
+    fail_big = create_test_result(
+        exit_code=2,
+        addresses=(Address("t0"),),
+    )
+    assert sorted([fail_big, negative_fail1, success2]) == [success2, negative_fail1, fail_big]
+
+    # A batched result is described by its first address.
+    batch_fail = create_test_result(
+        exit_code=1,
+        addresses=(Address("t1"), Address("t3")),
+    )
+    assert batch_fail.description == "t1:t1 and 1 other files"
+    assert sorted([fail2, batch_fail, fail1]) == [fail1, batch_fail, fail2]
+
 
 def assert_streaming_output(
     *,
@@ -6,7 +6,7 @@ from __future__ import annotations
 import re
 import shlex
 import textwrap
-from typing import Iterable
+from typing import Callable, Iterable, cast
 
 
 def ensure_binary(text_or_binary: bytes | str) -> bytes:
@@ -271,6 +271,37 @@ def softwrap(text: str) -> str:
     return "".join(result_strs).rstrip()
 
 
+class _LazyHelp:
+    """A class attribute descriptor that computes its value on first access.
+
+    The result then replaces the descriptor on the accessing class.
+    """
+
+    def __init__(self, compute: Callable[[], str]) -> None:
+        self._compute = compute
+        self._name = ""
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self._name = name
+
+    def __get__(self, obj: object, objtype: type | None = None) -> str:
+        value = self._compute()
+        setattr(objtype if objtype is not None else type(obj), self._name, value)
+        return value
+
+
+def lazy_help(compute: Callable[[], str]) -> str:
+    """Defer computing a `help` class attribute until it is first read.
+
+    Help text is only needed by `./pants help` and docs generation, so this avoids paying for e.g.
+    `softwrap` at import time on every run:
+
+        class MyField(StringField):
+            help = lazy_help(lambda: softwrap("..."))
+    """
+    return cast(str, _LazyHelp(compute))
+
+
 _MEMORY_UNITS = ["B", "KiB", "MiB", "GiB"]
 
 
@@ -13,6 +13,7 @@ from pants.util.strutil import (
     first_paragraph,
     fmt_memory_size,
     hard_wrap,
+    lazy_help,
     path_safe,
     pluralize,
     softwrap,
@@ -374,3 +375,29 @@ _TEST_MEMORY_SIZES_PARAMS = [
 @pytest.mark.parametrize("mem_size, expected", _TEST_MEMORY_SIZES_PARAMS)
 def test_fmt_memory_sizes(mem_size: int, expected: str) -> None:
     assert fmt_memory_size(mem_size) == expected
+
+
+def test_lazy_help() -> None:
+    calls = []
+
+    def compute() -> str:
+        calls.append(None)
+        return softwrap(
+            """
+            Some help
+            text.
+            """
+        )
+
+    class Parent:
+        help = lazy_help(compute)
+
+    class Child(Parent):
+        pass
+
+    assert not calls
+    assert Parent.help == "Some help text."
+    assert Parent().help == "Some help text."
+    assert len(calls) == 1
+    assert Parent.__dict__["help"] == "Some help text."
+    assert Child.help == "Some help text."